@@ -22,10 +22,22 @@ from claude_agent_sdk import query
 from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
 import asyncio
 
+from hawk.config import REPLICATE_DEFAULT_PARAMS
+from hawk.replicate_client import download_async
+
 
 MODEL = "digital-prairie-labs/futuristic:27415b8d4f84571b5ae8828da7da1cae63bdcd9fa54ccbc723bfdeb984cc128d"
 OUTPUT_DIR = Path("content/dxp-albs/images")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+if not OUTPUT_DIR.exists():
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Shared client so repeated downloads reuse the pooled connection
+_HTTP = httpx.AsyncClient(follow_redirects=True, timeout=60)
+
+# Shared Replicate defaults; only the prompt varies per call
+INPUT_BASE = {**REPLICATE_DEFAULT_PARAMS, "aspect_ratio": "9:16"}
+POLL_INTERVAL = 1.5
+_TERMINAL_STATES = ("succeeded", "failed", "canceled")
 
 
 async def claude_reflect_on_self() -> str:
@@ -46,17 +58,18 @@ Output a sparse image prompt (15-20 words max). Start with "TOK cloaked wanderer
 Focus on GEOMETRIC and ALGORITHMIC imagery. No sky, no streams - pure structure.
 Output ONLY the prompt, nothing else."""
 
-    result = ""
+    parts: list[str] = []
+    final: str | None = None
     async for message in query(prompt=prompt):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    result += block.text
+                    parts.append(block.text)
         elif isinstance(message, ResultMessage):
             if message.result:
-                result = message.result
+                final = message.result
 
-    return result.strip()
+    return (final if final else "".join(parts)).strip()
 
 
 async def claude_explain_self_portrait(image_prompt: str) -> str:
@@ -75,49 +88,45 @@ about how you actually work? Connect the visual elements to:
 
 Be technical yet poetic. 3-4 sentences."""
 
-    result = ""
+    parts: list[str] = []
+    final: str | None = None
     async for message in query(prompt=prompt):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    result += block.text
+                    parts.append(block.text)
         elif isinstance(message, ResultMessage):
             if message.result:
-                result = message.result
+                final = message.result
 
-    return result.strip()
+    return (final if final else "".join(parts)).strip()
 
 
-def generate_image(prompt: str) -> Path:
+async def generate_image(prompt: str) -> Path:
     """Generate the self-portrait image."""
     print(f"Generating: {prompt}")
 
-    output = replicate.run(
-        MODEL,
-        input={
-            "model": "dev",
-            "prompt": prompt,
-            "go_fast": False,
-            "lora_scale": 1,
-            "megapixels": "1",
-            "num_outputs": 1,
-            "aspect_ratio": "9:16",
-            "output_format": "png",
-            "guidance_scale": 3,
-            "output_quality": 90,
-            "num_inference_steps": 28,
-        }
+    # Create the prediction and poll it from the event loop rather than
+    # holding a thread in replicate.run for the whole generation
+    prediction = await replicate.predictions.async_create(
+        version=MODEL.split(":")[1],
+        input={**INPUT_BASE, "prompt": prompt},
     )
+    while prediction.status not in _TERMINAL_STATES:
+        await asyncio.sleep(POLL_INTERVAL)
+        await prediction.async_reload()
+    if prediction.status != "succeeded":
+        raise RuntimeError(f"Prediction {prediction.status}: {prediction.error}")
+    output = prediction.output
 
     url = output[0] if isinstance(output, list) else output
-    response = httpx.get(str(url), follow_redirects=True)
-    response.raise_for_status()
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filepath = OUTPUT_DIR / f"claude_self_portrait_{timestamp}.png"
 
-    with open(filepath, "wb") as f:
-        f.write(response.content)
+    # Stream straight to disk instead of buffering the whole PNG,
+    # retrying transient CDN/network failures with hawk's download policy
+    await download_async(_HTTP, str(url), filepath)
 
     return filepath
 
@@ -135,15 +144,18 @@ async def main():
     print(f"  \"{self_portrait_prompt}\"")
     print()
 
-    # Step 2: Generate the image
+    # Steps 2 & 3: The explanation only needs the prompt, not the image,
+    # so generate the image and ask Claude to explain concurrently
     print("[2/3] Generating self-portrait image...")
-    image_path = generate_image(self_portrait_prompt)
+    print("[3/3] Asking Claude to explain the symbolism...")
+    async with asyncio.TaskGroup() as tg:
+        img_task = tg.create_task(generate_image(self_portrait_prompt))
+        expl_task = tg.create_task(claude_explain_self_portrait(self_portrait_prompt))
+    image_path = img_task.result()
+    explanation = expl_task.result()
     print(f"  Saved: {image_path}")
     print()
 
-    # Step 3: Ask Claude to explain
-    print("[3/3] Asking Claude to explain the symbolism...")
-    explanation = await claude_explain_self_portrait(self_portrait_prompt)
     print(f"\nClaude's reflection:")
     print("-" * 50)
     print(explanation)
@@ -157,7 +169,12 @@ async def main():
 
     # Open the image
     import subprocess
-    subprocess.run(["open", str(image_path)])
+    subprocess.Popen(
+        ["open", str(image_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 if __name__ == "__main__":
@@ -4,12 +4,17 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Header, Footer, Input, Static
 from textual.binding import Binding
+from textual.geometry import Region
 from textual.reactive import reactive
 from textual.message import Message
 from textual import work
 from rich.text import Text
 from rich.panel import Panel
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+import re
+import subprocess
 
 from hawk.config import PROJECTS, COLORS, Project, USE_OLLAMA, USE_LOCAL_IMAGE_GEN, VERBOSE
 from hawk import image_generator, video
@@ -17,12 +22,99 @@ from hawk.logger import logger
 from hawk.screens.splash import SplashScreen
 from hawk.screens.captions import CaptionEditor
 
+# Style fragments resolved once at import instead of on every render
+ACCENT = COLORS["accent"]
+BORDER = COLORS["border"]
+DIM = COLORS["dim"]
+SUCCESS = COLORS["success"]
+ACCENT_BOLD_OPEN = f"[bold {ACCENT}]"
+END = "[/]"
+CURSOR_MARK = f"{ACCENT_BOLD_OPEN}▶{END}"
+SELECT_MARK = f"[green]✓{END}"
+
+# Trailing "xN" on a prompt requests N images, e.g. "misty forest x4"
+_BATCH_RE = re.compile(r"^(.*\S)\s+x(\d+)$")
+MAX_BATCH = 8
+# Concurrent Replicate jobs per batch (local generation shares one pipeline)
+MAX_BATCH_WORKERS = 4
+# Seconds to wait before repainting the status bar after set_status
+STATUS_FLUSH_DELAY = 0.05
+
+
+def _open_path(path: Path) -> None:
+    """Open a file or folder with macOS `open` without waiting for it."""
+    subprocess.Popen(
+        ["open", str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _parse_batch(prompt: str) -> tuple[str, int]:
+    """Split a prompt into (text, count) using the trailing "xN" suffix."""
+    match = _BATCH_RE.match(prompt)
+    if not match:
+        return prompt, 1
+    return match.group(1), max(1, min(int(match.group(2)), MAX_BATCH))
+
+
+# Keybinding reference for the right-hand panel (fully static)
+_HELP_TEXT = f"""[bold]Navigation[/]
+[{ACCENT}]↑/↓[/] Move cursor
+[{ACCENT}]Tab[/] Switch panels
+[{ACCENT}]Enter[/] Select/Open
+
+[bold]Images[/]
+[{ACCENT}]Space[/] Toggle select
+[{ACCENT}]a[/] Select all
+[{ACCENT}]p[/] Preview (chafa)
+[{ACCENT}]Esc[/] Clear selection
+
+[bold]Actions[/]
+[{ACCENT}]xN[/] Batch (prompt x4)
+[{ACCENT}]v[/] Create video + captions
+[{ACCENT}]b[/] Browse folder
+[{ACCENT}]d[/] Delete selected
+[{ACCENT}]l[/] View logs
+
+[bold]Projects[/]
+[{ACCENT}]1[/] Wedding Vision
+[{ACCENT}]2[/] Latin Bible
+[{ACCENT}]3[/] DXP Labs
+
+[{ACCENT}]q[/] Quit"""
+
+
+# (shortcut number, slug, project) in display order
+_PROJECT_ITEMS: list[tuple[int, str, Project]] = [
+    (i, slug, proj) for i, (slug, proj) in enumerate(PROJECTS.items(), 1)
+]
+
+
+def _project_markup(selected: str) -> str:
+    """Project list markup with the given slug highlighted."""
+    lines = []
+    for i, slug, proj in _PROJECT_ITEMS:
+        if slug == selected:
+            line = f"{ACCENT_BOLD_OPEN}▶ [{i}] {proj.name}{END}"
+        else:
+            line = f"  [{DIM}][{i}]{END} {proj.name}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# PROJECTS is static, so there is exactly one panel per possible selection
+_PROJECT_PANELS: dict[str, Panel] = {
+    slug: Panel(_project_markup(slug), title="[bold]PROJECTS[/]", border_style=BORDER)
+    for _, slug, _ in _PROJECT_ITEMS
+}
+
 
 class ProjectSelector(Static, can_focus=True):
     """Sidebar showing available projects."""
 
-    selected = reactive("dxp-labs")
-    _project_slugs = list(PROJECTS.keys())
+    _project_slugs = [slug for _, slug, _ in _PROJECT_ITEMS]
 
     BINDINGS = [
         Binding("up", "move_up", "Up", priority=True),
@@ -32,6 +124,20 @@ class ProjectSelector(Static, can_focus=True):
         Binding("enter", "select", "Select", priority=True),
     ]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._selected_slug = "dxp-labs"
+
+    @property
+    def selected(self) -> str:
+        return self._selected_slug
+
+    @selected.setter
+    def selected(self, slug: str) -> None:
+        if slug != self._selected_slug:
+            self._selected_slug = slug
+            self.refresh()
+
     def action_move_up(self) -> None:
         """Move to previous project."""
         idx = self._project_slugs.index(self.selected)
@@ -63,26 +169,12 @@ class ProjectSelector(Static, can_focus=True):
             self.value = value
 
     def render(self) -> Panel:
-        lines = []
-        for i, (slug, proj) in enumerate(PROJECTS.items(), 1):
-            if slug == self.selected:
-                line = f"[bold {COLORS['accent']}]▶ [{i}] {proj.name}[/]"
-            else:
-                line = f"  [{COLORS['dim']}][{i}][/] {proj.name}"
-            lines.append(line)
-
-        return Panel(
-            "\n".join(lines),
-            title="[bold]PROJECTS[/]",
-            border_style=COLORS["border"],
-        )
+        return _PROJECT_PANELS[self.selected]
 
 
 class ImageList(Static, can_focus=True):
     """Display list of images in current project."""
 
-    cursor = reactive(0)
-
     BINDINGS = [
         Binding("up", "move_up", "Up", priority=True),
         Binding("down", "move_down", "Down", priority=True),
@@ -97,31 +189,70 @@ class ImageList(Static, can_focus=True):
         super().__init__(**kwargs)
         self._images: list[Path] = []
         self._selected: set[int] = set()
+        # Plain attribute: mutators decide what to repaint (see _refresh_cursor_rows)
+        self.cursor = 0
+        # Display names, truncated once per image set
+        self._names: list[str] = []
+        # Static "[ n] name" portion of each row, aligned with self._images
+        self._row_cache: list[str] = []
+        # Last rendered panel, reused until a mutator marks it dirty
+        self._cached_panel: Panel | None = None
+        self._cache_key: tuple[int, int, int] | None = None
+        self._dirty = True
 
     def set_images(self, images: list[Path]) -> None:
         """Update the image list."""
         self._images = images
+        self._names = [
+            n if len(n := img.name) <= 35 else n[:32] + "..."
+            for img in images
+        ]
+        self._row_cache = [f"[{i+1:2}] {name}" for i, name in enumerate(self._names)]
         self._selected = set()
         self.cursor = 0
+        self._dirty = True
         self.refresh()
 
     def action_move_up(self) -> None:
         """Move cursor up."""
         if self._images and self.cursor > 0:
             self.cursor -= 1
-            self.refresh()
+            self._dirty = True
+            self._refresh_cursor_rows(self.cursor + 1)
 
     def action_move_down(self) -> None:
         """Move cursor down."""
         if self._images and self.cursor < len(self._images) - 1:
             self.cursor += 1
+            self._dirty = True
+            self._refresh_cursor_rows(self.cursor - 1)
+
+    @staticmethod
+    def _window_start(cursor: int) -> int:
+        """First visible row index for a given cursor position."""
+        return max(0, cursor - 8)
+
+    def _refresh_cursor_rows(self, old_cursor: int) -> None:
+        """Repaint only the old and new cursor rows if the window didn't scroll."""
+        start = self._window_start(self.cursor)
+        if start != self._window_start(old_cursor):
             self.refresh()
+            return
+
+        # Regions are content-relative (Textual adds the gutter offset itself);
+        # rows start below the panel's top border
+        top = 1
+        width = self.size.width
+        rows = [old_cursor - start, self.cursor - start]
+        if len(self._images) > 18:
+            # The "(n/total)" position line follows the visible rows
+            rows.append(min(len(self._images), start + 18) - start)
+        self.refresh(*(Region(0, top + row, width, 1) for row in rows))
 
     def action_open_current(self) -> None:
         """Open current image."""
         if self._images and 0 <= self.cursor < len(self._images):
-            import subprocess
-            subprocess.Popen(["open", str(self._images[self.cursor])])
+            _open_path(self._images[self.cursor])
 
     def action_toggle_select(self) -> None:
         """Toggle selection of current image."""
@@ -130,16 +261,19 @@ class ImageList(Static, can_focus=True):
                 self._selected.discard(self.cursor)
             else:
                 self._selected.add(self.cursor)
+            self._dirty = True
             self.refresh()
 
     def action_select_all(self) -> None:
         """Select all images."""
         self._selected = set(range(len(self._images)))
+        self._dirty = True
         self.refresh()
 
     def clear_selection(self) -> None:
         """Clear all selections."""
         self._selected = set()
+        self._dirty = True
         self.refresh()
 
     @property
@@ -151,19 +285,21 @@ class ImageList(Static, can_focus=True):
         return self._selected
 
     def render(self) -> Panel:
+        key = (len(self._images), len(self._selected), self.cursor)
+        if not self._dirty and self._cached_panel is not None and key == self._cache_key:
+            return self._cached_panel
+
         if not self._images:
             content = f"[dim]No images yet.\n\nType a prompt below and press Enter to generate.[/]"
         else:
             lines = []
-            start = max(0, self.cursor - 8)
+            start = self._window_start(self.cursor)
             end = min(len(self._images), start + 18)
 
-            for i in range(start, end):
-                img = self._images[i]
-                cursor_mark = f"[bold {COLORS['accent']}]▶[/]" if i == self.cursor else " "
-                select_mark = f"[green]✓[/]" if i in self._selected else " "
-                name = img.name[:32] + "..." if len(img.name) > 35 else img.name
-                lines.append(f"{cursor_mark}{select_mark}[{i+1:2}] {name}")
+            for i, row in enumerate(self._row_cache[start:end], start):
+                cursor_mark = CURSOR_MARK if i == self.cursor else " "
+                select_mark = SELECT_MARK if i in self._selected else " "
+                lines.append(cursor_mark + select_mark + row)
 
             content = "\n".join(lines)
             if len(self._images) > 18:
@@ -172,10 +308,13 @@ class ImageList(Static, can_focus=True):
         selected_count = len(self._selected)
         title = f"[bold]IMAGES ({len(self._images)})"
         if selected_count > 0:
-            title += f" [{COLORS['accent']}]{selected_count} selected[/]"
+            title += f" [{ACCENT}]{selected_count} selected{END}"
         title += "[/]"
 
-        return Panel(content, title=title, border_style=COLORS["border"])
+        self._cached_panel = Panel(content, title=title, border_style=BORDER)
+        self._cache_key = key
+        self._dirty = False
+        return self._cached_panel
 
 
 class PromptInput(Input):
@@ -292,12 +431,19 @@ class HawkTUI(App):
 
     current_project = reactive("dxp-labs")
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Latest (message, working) waiting for the next status-bar flush
+        self._pending_status: tuple[str, bool] | None = None
+        # (message, working) currently shown, to skip identical re-renders
+        self._shown_status: tuple[str, bool] | None = None
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Container(
             Container(ProjectSelector(id="project-selector"), id="left-panel"),
             Container(ImageList(id="image-list"), id="center-panel"),
-            Container(Static(self._help_text(), id="help-panel"), id="right-panel"),
+            Container(Static(_HELP_TEXT, id="help-panel"), id="right-panel"),
             id="main-container",
         )
         yield PromptInput(
@@ -307,31 +453,6 @@ class HawkTUI(App):
         yield Static("Ready", id="status-bar")
         yield Footer()
 
-    def _help_text(self) -> str:
-        return f"""[bold]Navigation[/]
-[{COLORS['accent']}]↑/↓[/] Move cursor
-[{COLORS['accent']}]Tab[/] Switch panels
-[{COLORS['accent']}]Enter[/] Select/Open
-
-[bold]Images[/]
-[{COLORS['accent']}]Space[/] Toggle select
-[{COLORS['accent']}]a[/] Select all
-[{COLORS['accent']}]p[/] Preview (chafa)
-[{COLORS['accent']}]Esc[/] Clear selection
-
-[bold]Actions[/]
-[{COLORS['accent']}]v[/] Create video + captions
-[{COLORS['accent']}]b[/] Browse folder
-[{COLORS['accent']}]d[/] Delete selected
-[{COLORS['accent']}]l[/] View logs
-
-[bold]Projects[/]
-[{COLORS['accent']}]1[/] Wedding Vision
-[{COLORS['accent']}]2[/] Latin Bible
-[{COLORS['accent']}]3[/] DXP Labs
-
-[{COLORS['accent']}]q[/] Quit"""
-
     def on_mount(self) -> None:
         """Initialize the app."""
         self.push_screen(SplashScreen())
@@ -350,7 +471,8 @@ class HawkTUI(App):
         return self.query_one("#image-list", ImageList)
 
     def refresh_images(self) -> None:
-        images = image_generator.get_project_images(self.project)
+        # Project.list_images only rescans when the folder has changed
+        images = self.project.list_images()
         self.image_list.set_images(images)
         backend_status = image_generator.get_backend_status()
         self.set_status(f"{self.project.name}: {len(images)} images | {backend_status}")
@@ -361,11 +483,27 @@ class HawkTUI(App):
         self.refresh_images()
 
     def set_status(self, message: str, working: bool = False) -> None:
+        # Coalesce bursts (e.g. per-step progress) into one repaint
+        flush_scheduled = self._pending_status is not None
+        self._pending_status = (message, working)
+        if not flush_scheduled:
+            self.set_timer(STATUS_FLUSH_DELAY, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Write the most recent pending status to the status bar."""
+        if self._pending_status is None:
+            return
+        key = self._pending_status
+        self._pending_status = None
+        if key == self._shown_status:
+            return
+        self._shown_status = key
+        message, working = key
         status = self.query_one("#status-bar", Static)
         if working:
-            status.update(f"[bold {COLORS['accent']}]⏳ {message}[/]")
+            status.update(f"{ACCENT_BOLD_OPEN}⏳ {message}{END}")
         else:
-            status.update(f"[{COLORS['success']}]✓[/] {message}")
+            status.update(f"[{SUCCESS}]✓{END} {message}")
 
     # Focus management
     def action_focus_next(self) -> None:
@@ -437,6 +575,7 @@ class HawkTUI(App):
     @work(exclusive=True, thread=True)
     def _do_generate(self, prompt: str) -> None:
         """Generate images."""
+        prompt, count = _parse_batch(prompt)
         self.call_from_thread(self._show_generating, prompt)
         
         def progress_update(step: int, total: int, status: str):
@@ -453,16 +592,49 @@ class HawkTUI(App):
                 self.call_from_thread(self.set_status, f"⏳ {status}", True)
         
         try:
-            logger.info(f"User requested generation: {prompt[:50]}...")
-            paths, metadata = image_generator.generate_image(
-                self.project, 
-                prompt,
-                progress_callback=progress_update,
-            )
+            logger.info(f"User requested generation ({count}x): {prompt[:50]}...")
+            workers = 1 if USE_LOCAL_IMAGE_GEN else min(count, MAX_BATCH_WORKERS)
+            paths: list[Path] = []
+            enhanced = False
+            succeeded = 0
+            last_error = ""
+            # Check Ollama once for the whole batch rather than per job
+            ollama_ok = image_generator.is_ollama_available()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                jobs = [
+                    pool.submit(
+                        image_generator.generate_image,
+                        self.project,
+                        prompt,
+                        progress_callback=progress_update,
+                        ollama_ok=ollama_ok,
+                    )
+                    for _ in range(count)
+                ]
+                for job in as_completed(jobs):
+                    # One failed job shouldn't discard the others' images
+                    try:
+                        job_paths, metadata = job.result()
+                    except Exception as e:
+                        import traceback
+                        last_error = f"{type(e).__name__}: {str(e)}"
+                        logger.error(f"Generation failed: {last_error}")
+                        logger.error(traceback.format_exc())
+                        continue
+                    succeeded += 1
+                    paths.extend(job_paths)
+                    enhanced = enhanced or metadata.get("enhanced", False)
+            # Refresh before reporting: refresh_images sets its own status line
             self.call_from_thread(self.refresh_images)
+            if not succeeded:
+                # Show full error in status (truncated for display)
+                self.call_from_thread(self.set_status, f"Error: {last_error[:80]}")
+                return
             # Show enhanced status if prompt was enhanced
             status_msg = f"Generated {len(paths)} image(s)"
-            if metadata.get("enhanced"):
+            if succeeded < count:
+                status_msg += f" ({succeeded} of {count} succeeded)"
+            if enhanced:
                 status_msg += " [enhanced]"
             self.call_from_thread(self.set_status, status_msg)
             self.call_from_thread(self._focus_images)
@@ -471,6 +643,8 @@ class HawkTUI(App):
             error_msg = f"{type(e).__name__}: {str(e)}"
             logger.error(f"Generation failed: {error_msg}")
             logger.error(traceback.format_exc())
+            # Pick up whatever reached disk before showing the error
+            self.call_from_thread(self.refresh_images)
             # Show full error in status (truncated for display)
             self.call_from_thread(self.set_status, f"Error: {error_msg[:80]}")
         finally:
@@ -523,7 +697,11 @@ class HawkTUI(App):
             return
 
         # Get selected image paths
-        selected_paths = [images[i] for i in sorted(selected)]
+        idx = sorted(selected)
+        if len(idx) > 1:
+            selected_paths = list(itemgetter(*idx)(images))
+        else:
+            selected_paths = [images[idx[0]]]
         
         # Show caption editor modal
         def handle_captions(captions: list[str] | None) -> None:
@@ -557,23 +735,20 @@ class HawkTUI(App):
             self.call_from_thread(self.set_status, f"✅ Video saved: {output.name}")
             
             # Open the exports folder
-            import subprocess
-            subprocess.run(["open", str(output.parent)])
+            _open_path(output.parent)
         except Exception as e:
             logger.error(f"Video creation failed: {e}")
             self.call_from_thread(self.set_status, f"❌ Error: {str(e)[:60]}")
 
     def action_browse(self) -> None:
         """Open the project images folder."""
-        import subprocess
-        subprocess.run(["open", str(self.project.images_dir)])
+        _open_path(self.project.images_dir)
         self.set_status(f"Opened {self.project.images_dir}")
 
     def action_view_logs(self) -> None:
         """Open the log file in default editor."""
-        import subprocess
         from hawk.config import LOG_FILE
-        subprocess.run(["open", str(LOG_FILE)])
+        _open_path(LOG_FILE)
         self.set_status(f"Opened log: {LOG_FILE}")
 
     def action_preview_image(self) -> None:
@@ -587,7 +762,6 @@ class HawkTUI(App):
         
         image_path = images[cursor]
         
-        import subprocess
         import shutil
         
         # Check if chafa is available for in-terminal preview
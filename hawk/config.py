@@ -2,30 +2,21 @@
 
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from dotenv import load_dotenv
 
+from hawk.setup import load_config
+
 # Load .env file (for backwards compatibility)
 load_dotenv()
 
-# Also load from ~/.config/hawk/config.toml if it exists
-_CONFIG_FILE = Path.home() / ".config" / "hawk" / "config.toml"
-if _CONFIG_FILE.exists():
-    try:
-        with open(_CONFIG_FILE) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    # Only set if not already in environment (env vars take precedence)
-                    if key not in os.environ:
-                        os.environ[key] = value
-    except Exception:
-        pass
+# Also load from ~/.config/hawk/config.toml if it exists (same reader as `hawk config`)
+for key, value in load_config().items():
+    # Only set if not already in environment (env vars take precedence)
+    if key not in os.environ:
+        os.environ[key] = value
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
@@ -36,6 +27,13 @@ if _custom_content:
 else:
     CONTENT_DIR = BASE_DIR / "content"
 
+# File types shown in the image list
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+
+# Project slugs whose directories were already created this process
+# (ensure_dirs still re-checks images_dir so a deleted folder is recreated)
+_ENSURED: set[str] = set()
+
 
 @dataclass
 class Project:
@@ -45,6 +43,10 @@ class Project:
     model: str
     trigger: str
     description: str
+    # (directory fingerprint, newest-first image paths) from the last scan
+    _image_cache: Optional[tuple[tuple[int, int], list[Path]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def images_dir(self) -> Path:
@@ -60,9 +62,34 @@ class Project:
 
     def ensure_dirs(self):
         """Create project directories if they don't exist."""
+        # One stat instead of three mkdirs; also notices a folder deleted
+        # mid-session, which list_images and downloads would otherwise hit
+        if self.slug in _ENSURED and self.images_dir.is_dir():
+            return
         self.images_dir.mkdir(parents=True, exist_ok=True)
         self.audio_dir.mkdir(parents=True, exist_ok=True)
         self.exports_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(self.slug)
+
+    def list_images(self) -> list[Path]:
+        """List project images newest first, rescanning only when the folder changes."""
+        self.ensure_dirs()
+        images_dir = self.images_dir
+        st = images_dir.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if self._image_cache is not None and self._image_cache[0] == key:
+            return self._image_cache[1]
+
+        with os.scandir(images_dir) as it:
+            entries = [
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in it
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+            ]
+        entries.sort(key=lambda e: e[1], reverse=True)
+        images = [images_dir / name for name, _ in entries]
+        self._image_cache = (key, images)
+        return images
 
 
 # Your 3 custom Replicate models
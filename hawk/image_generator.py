@@ -4,6 +4,8 @@ Routes to either Replicate API or local Diffusers based on configuration.
 Optionally enhances prompts using Ollama when enabled.
 """
 
+import asyncio
+import time
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -16,6 +18,18 @@ from hawk.config import (
 )
 from hawk import logger
 
+# Bind optional backends once so hot paths (e.g. TUI status) skip the import machinery
+_local_image_gen = None
+_ollama_client = None
+if USE_LOCAL_IMAGE_GEN:
+    from hawk import local_image_gen as _local_image_gen
+if USE_OLLAMA:
+    from hawk import ollama_client as _ollama_client
+
+# Last backend status string, reused for STATUS_TTL seconds
+STATUS_TTL = 2.0
+_STATUS_CACHE = {"t": float("-inf"), "s": ""}
+
 
 def get_backend_info() -> dict:
     """Get information about current backend configuration."""
@@ -28,25 +42,26 @@ def get_backend_info() -> dict:
     
     # Check availability
     if USE_LOCAL_IMAGE_GEN:
-        from hawk import local_image_gen
-        info["local_available"] = local_image_gen.is_available()
-        info["device_info"] = local_image_gen.get_device_info()
+        info["local_available"] = _local_image_gen.is_available()
+        info["device_info"] = _local_image_gen.get_device_info()
     
     if USE_OLLAMA:
-        from hawk import ollama_client
-        info["ollama_available"] = ollama_client.is_available()
+        info["ollama_available"] = _ollama_client.is_available()
     
     return info
 
 
 def get_backend_status() -> str:
-    """Get a short status string for display in TUI."""
+    """Get a short status string for display in TUI (cached briefly)."""
+    now = time.monotonic()
+    if now - _STATUS_CACHE["t"] < STATUS_TTL:
+        return _STATUS_CACHE["s"]
+    
     parts = []
     
     if USE_LOCAL_IMAGE_GEN:
-        from hawk import local_image_gen
-        if local_image_gen.is_available():
-            device = local_image_gen.get_device_info()
+        if _local_image_gen.is_available():
+            device = _local_image_gen.get_device_info()
             if device["cuda"]:
                 parts.append(f"Local (CUDA)")
             elif device["mps"]:
@@ -59,32 +74,19 @@ def get_backend_status() -> str:
         parts.append("Replicate")
     
     if USE_OLLAMA:
-        from hawk import ollama_client
-        if ollama_client.is_available():
+        if _ollama_client.is_available():
             parts.append(f"Ollama:{OLLAMA_MODEL}")
         else:
             parts.append("Ollama (offline)")
     
-    return " | ".join(parts)
+    status = " | ".join(parts)
+    _STATUS_CACHE.update(t=now, s=status)
+    return status
 
 
-def _maybe_enhance_prompt(prompt: str, style_hint: Optional[str] = None) -> tuple[str, bool]:
-    """
-    Enhance prompt with Ollama if enabled.
-    
-    Returns:
-        Tuple of (prompt, was_enhanced)
-    """
-    if not USE_OLLAMA:
-        return prompt, False
-    
-    from hawk import ollama_client
-    
-    if not ollama_client.is_available():
-        return prompt, False
-    
-    enhanced = ollama_client.enhance_prompt(prompt, style_hint=style_hint)
-    return enhanced, enhanced != prompt
+def is_ollama_available() -> bool:
+    """True if prompt enhancement is enabled and the Ollama server is reachable."""
+    return USE_OLLAMA and _ollama_client.is_available()
 
 
 def generate_image(
@@ -96,6 +98,7 @@ def generate_image(
     enhance_prompt: bool = True,
     style_hint: Optional[str] = None,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ollama_ok: Optional[bool] = None,
 ) -> tuple[list[Path], dict]:
     """
     Generate images using the configured backend.
@@ -109,6 +112,8 @@ def generate_image(
         enhance_prompt: Whether to use Ollama for prompt enhancement (if enabled)
         style_hint: Optional style guidance for prompt enhancement
         progress_callback: Optional callback(step, total, status) for progress updates
+        ollama_ok: Known Ollama availability (e.g. checked once per batch);
+            probed here when None
     
     Returns:
         Tuple of (list of image paths, metadata dict)
@@ -126,10 +131,14 @@ def generate_image(
     # Optionally enhance prompt
     final_prompt = prompt
     if enhance_prompt and USE_OLLAMA:
-        if progress_callback:
-            progress_callback(0, 1, "Enhancing prompt with Ollama...")
-        logger.info(f"Enhancing prompt with Ollama ({OLLAMA_MODEL})...")
-        final_prompt, was_enhanced = _maybe_enhance_prompt(prompt, style_hint)
+        if ollama_ok is None:
+            ollama_ok = _ollama_client.is_available()
+        if ollama_ok:
+            if progress_callback:
+                progress_callback(0, 1, "Enhancing prompt with Ollama...")
+            logger.info(f"Enhancing prompt with Ollama ({OLLAMA_MODEL})...")
+            final_prompt = _ollama_client.enhance_prompt(prompt, style_hint=style_hint)
+        was_enhanced = final_prompt != prompt
         metadata["enhanced"] = was_enhanced
         metadata["final_prompt"] = final_prompt
         if was_enhanced:
@@ -141,10 +150,8 @@ def generate_image(
     # Generate using appropriate backend
     try:
         if USE_LOCAL_IMAGE_GEN:
-            from hawk import local_image_gen
-            
             logger.info(f"Generating with local Diffusers ({SD_MODEL})...")
-            paths = local_image_gen.generate_image(
+            paths = _local_image_gen.generate_image(
                 project=project,
                 prompt=final_prompt,
                 num_outputs=num_outputs,
@@ -174,29 +181,128 @@ def generate_image(
         raise
 
 
-def generate_batch(
+async def generate_batch_async(
     project: Project,
     prompts: list[str],
     aspect_ratio: str = "9:16",
     enhance_prompts: bool = True,
+    max_enhance_concurrency: int = 4,
+) -> tuple[list[Path], list[dict]]:
+    """
+    Generate images for multiple prompts, overlapping enhancement with generation.
+    
+    Enhancement requests run concurrently (up to max_enhance_concurrency),
+    while image generation is serialized so only one job uses the GPU at a
+    time; each image starts as soon as its prompt is ready. Duplicate
+    prompts are generated once; each occurrence gets the same image paths
+    and a copy of the same metadata.
+    """
+    # Coalesce duplicates, keeping first-seen order
+    unique = list(dict.fromkeys(prompts))
+    if len(unique) < len(prompts):
+        logger.info(f"Batch has {len(prompts) - len(unique)} duplicate prompt(s); generating each once")
+    
+    gpu = asyncio.Semaphore(1)
+    
+    async def run_one(prompt: str, enhance) -> tuple[list[Path], dict]:
+        final_prompt = await enhance(prompt) if enhance else prompt
+        async with gpu:
+            paths, meta = await asyncio.to_thread(
+                generate_image,
+                project=project,
+                prompt=final_prompt,
+                aspect_ratio=aspect_ratio,
+                enhance_prompt=False,
+            )
+        meta["original_prompt"] = prompt
+        meta["enhanced"] = final_prompt != prompt
+        meta["final_prompt"] = final_prompt
+        return paths, meta
+    
+    if unique and enhance_prompts and USE_OLLAMA and _ollama_client.is_available():
+        logger.info(f"Enhancing {len(unique)} prompts with Ollama ({OLLAMA_MODEL})...")
+        async with _ollama_client.async_enhancer(max_concurrency=max_enhance_concurrency) as enhance:
+            generated = await asyncio.gather(*(run_one(p, enhance) for p in unique))
+    else:
+        generated = await asyncio.gather(*(run_one(p, None) for p in unique))
+    return _fan_out(prompts, dict(zip(unique, generated)))
+
+
+def _fan_out(
+    prompts: list[str],
+    results: dict[str, tuple[list[Path], dict]],
 ) -> tuple[list[Path], list[dict]]:
-    """Generate images for multiple prompts."""
+    """Expand per-unique-prompt results back out in the caller's order."""
     all_paths = []
     all_metadata = []
-    
     for prompt in prompts:
+        paths, meta = results[prompt]
+        all_paths.extend(paths)
+        all_metadata.append(dict(meta))
+    return all_paths, all_metadata
+
+
+def _generate_batch_serial(
+    project: Project,
+    prompts: list[str],
+    aspect_ratio: str,
+    enhance_prompts: bool,
+) -> tuple[list[Path], list[dict]]:
+    """Enhance all prompts up front with batched Ollama requests, then generate in turn."""
+    unique = list(dict.fromkeys(prompts))
+    final_prompts = unique
+    if unique and enhance_prompts and is_ollama_available():
+        logger.info(f"Enhancing {len(unique)} prompts with Ollama ({OLLAMA_MODEL})...")
+        final_prompts = _ollama_client.enhance_prompts_batch(unique)
+    
+    results = {}
+    for prompt, final_prompt in zip(unique, final_prompts):
         paths, meta = generate_image(
             project=project,
-            prompt=prompt,
+            prompt=final_prompt,
             aspect_ratio=aspect_ratio,
-            enhance_prompt=enhance_prompts,
+            enhance_prompt=False,
         )
-        all_paths.extend(paths)
-        all_metadata.append(meta)
+        meta["original_prompt"] = prompt
+        meta["enhanced"] = final_prompt != prompt
+        meta["final_prompt"] = final_prompt
+        results[prompt] = (paths, meta)
     
-    return all_paths, all_metadata
+    return _fan_out(prompts, results)
+
+
+def generate_batch(
+    project: Project,
+    prompts: list[str],
+    aspect_ratio: str = "9:16",
+    enhance_prompts: bool = True,
+) -> tuple[list[Path], list[dict]]:
+    """
+    Generate images for multiple prompts (sync wrapper for generate_batch_async).
+    
+    Called from inside a running event loop, where asyncio.run can't be
+    used, it falls back to batched enhancement and serial generation.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(
+            generate_batch_async(
+                project,
+                prompts,
+                aspect_ratio=aspect_ratio,
+                enhance_prompts=enhance_prompts,
+            )
+        )
+    return _generate_batch_serial(project, prompts, aspect_ratio, enhance_prompts)
 
 
-# Re-export utility functions from replicate_client for backwards compatibility
-from hawk.replicate_client import get_project_images, delete_image
+# Re-export utility functions from replicate_client for backwards compatibility.
+# Resolved lazily (PEP 562) so local-only setups never import the Replicate SDK.
+def __getattr__(name: str):
+    if name in ("get_project_images", "delete_image"):
+        from hawk.replicate_client import get_project_images, delete_image
+        globals().update(get_project_images=get_project_images, delete_image=delete_image)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
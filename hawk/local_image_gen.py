@@ -1,13 +1,15 @@
 """Local image generation using Hugging Face Diffusers."""
 
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
 
-# Fix macOS multiprocessing issue with diffusers
-os.environ["TOKENIZERS_PARALLELISM"] = "false"
-os.environ["OMP_NUM_THREADS"] = "1"
+# Fix macOS multiprocessing issue with diffusers (see hawk/main.py)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+if sys.platform == "darwin" and os.environ.get("HAWK_FORCE_SINGLE_THREAD"):
+    os.environ["OMP_NUM_THREADS"] = "1"
 
 from hawk.config import Project, SD_MODEL, TIKTOK_WIDTH, TIKTOK_HEIGHT, SD_INFERENCE_STEPS, SD_GUIDANCE_SCALE
 from hawk import logger
@@ -16,6 +18,7 @@ from hawk import logger
 _pipeline = None
 _current_model = None
 _model_loaded = False
+_torch_available: Optional[bool] = None
 
 
 def is_model_cached(model_name: Optional[str] = None) -> bool:
@@ -169,11 +172,14 @@ def _get_pipeline(model_name: Optional[str] = None):
 
 def is_available() -> bool:
     """Check if local image generation is available (torch installed)."""
-    try:
-        import torch
-        return True
-    except ImportError:
-        return False
+    global _torch_available
+    if _torch_available is None:
+        try:
+            import torch
+            _torch_available = True
+        except ImportError:
+            _torch_available = False
+    return _torch_available
 
 
 def get_device_info() -> dict:
@@ -275,7 +281,8 @@ def generate_image(
         generator = torch.Generator(device=device).manual_seed(seed)
     
     saved_paths = []
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep filenames unique across back-to-back batch jobs
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     
     # Create step callback for progress updates
     # Note: Different pipelines use different callback signatures
@@ -4,8 +4,11 @@ import os
 import sys
 
 # Fix macOS multiprocessing issue - must be set before any imports
-os.environ["TOKENIZERS_PARALLELISM"] = "false"
-os.environ["OMP_NUM_THREADS"] = "1"
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+# Let torch use all cores on CPU; only cap threads when explicitly asked
+# (macOS fork-safety workaround for multiprocessing)
+if sys.platform == "darwin" and os.environ.get("HAWK_FORCE_SINGLE_THREAD"):
+    os.environ["OMP_NUM_THREADS"] = "1"
 
 
 def _preload_local_model():
@@ -60,7 +63,8 @@ For more info: https://github.com/carsonmulligan/hawktui
 
 def _print_version():
     """Print version."""
-    print("hawk-tui 1.0.0")
+    from hawk import __version__
+    print(f"hawk-tui {__version__}")
 
 
 def main():
@@ -113,7 +117,13 @@ def main():
         print("\nStarting with defaults (local image generation)...\n")
 
     # Import config after potential setup
-    from hawk.config import USE_LOCAL_IMAGE_GEN
+    from hawk.config import USE_LOCAL_IMAGE_GEN, USE_OLLAMA
+
+    # Load the Ollama model in the background while the SD model loads
+    if USE_OLLAMA:
+        import threading
+        from hawk import ollama_client
+        threading.Thread(target=ollama_client.warmup, daemon=True).start()
 
     # Preload local model BEFORE starting Textual (avoids multiprocessing conflicts)
     if USE_LOCAL_IMAGE_GEN:
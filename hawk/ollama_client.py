@@ -1,11 +1,33 @@
 """Ollama client for prompt enhancement using local LLMs."""
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import json
+import re
+import socket
+import time
 import httpx
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
 from hawk.config import OLLAMA_HOST, OLLAMA_MODEL
 from hawk import logger
 
+# orjson is optional: faster parsing of (many small) streamed chunks
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # System prompt for enhancing image generation prompts
 # CLIP tokenizer limit is 77 tokens - we enforce ~50 words max
 ENHANCE_SYSTEM_PROMPT = """Enhance this prompt for Stable Diffusion. 
@@ -18,29 +40,232 @@ Output ONLY the enhanced prompt - no explanations."""
 # Maximum characters for enhanced prompts (77 tokens ≈ 250 chars)
 MAX_PROMPT_CHARS = 250
 
+# Numbered list item such as "1. foo", "2) bar" or "  3.baz"
+_NUM_RE = re.compile(r"^\s*\d+[.)]\s*(.+?)\s*$")
+
+# How long Ollama keeps the model loaded after any request (warmup included).
+# Every request must send the same value, or the last one wins
+KEEP_ALIVE = "10m"
+
+# Rough token count of the system prompt (~4 chars/token). Passed as
+# num_keep so Ollama retains that shared prefix in its KV cache
+_SYS_TOKENS = max(1, len(ENHANCE_SYSTEM_PROMPT) // 4)
+
+# Server-side limits for single-prompt enhancement: ~80 tokens covers
+# MAX_PROMPT_CHARS, so Ollama stops generating instead of us discarding
+ENHANCE_OPTIONS = {
+    "num_keep": _SYS_TOKENS,
+    "num_predict": 80,
+    "temperature": 0.7,
+    "num_ctx": 512,
+    "stop": ["\n\n"],
+}
+
+# Prompts per enhance_prompts_batch request. Batches reuse ENHANCE_OPTIONS
+# (a different num_ctx would reload the model), so each request must fit
+# the system prompt plus ~80 output tokens per prompt in num_ctx
+BATCH_CHUNK_SIZE = 4
+
+# Persistent cache of enhanced prompts, one file per request key
+_CACHE_DIR = Path.home() / ".cache" / "hawk" / "prompt_enh"
+
+# Shared client so the connection to Ollama stays open between calls
+_CLIENT = httpx.Client(
+    base_url=OLLAMA_HOST,
+    timeout=60.0,
+    headers={"Content-Type": "application/json"},
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+)
+atexit.register(_CLIENT.close)
+
+# Last availability probe result, reused for AVAILABILITY_TTL seconds
+AVAILABILITY_TTL = 30.0
+_AVAIL_CACHE = {"t": float("-inf"), "v": False}
+
+
+def warmup(model: Optional[str] = None) -> bool:
+    """Load the model into Ollama with the options enhancement will use."""
+    model = model or OLLAMA_MODEL
+    try:
+        logger.info(f"Warming up Ollama model {model}")
+        # An empty prompt makes Ollama load the model without generating.
+        # Same options as enhancement: a different num_ctx forces a reload
+        response = _CLIENT.post(
+            "/api/generate",
+            content=_dumps({
+                "model": model,
+                "prompt": "",
+                "keep_alive": KEEP_ALIVE,
+                "options": ENHANCE_OPTIONS,
+            }),
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return True
+    except Exception as e:
+        logger.debug(f"Ollama warmup failed: {type(e).__name__}: {e}")
+        return False
+
+
+def _truncate_prompt(enhanced: str) -> str:
+    """Enforce MAX_PROMPT_CHARS, cutting at the last comma or space before the limit."""
+    if len(enhanced) <= MAX_PROMPT_CHARS:
+        return enhanced
+    # Single reverse scan for the last break inside the limit
+    i = MAX_PROMPT_CHARS - 1
+    while i > 150 and enhanced[i] not in ", ":
+        i -= 1
+    if i > 150:
+        enhanced = enhanced[:i].rstrip(", ")
+    else:
+        enhanced = enhanced[:MAX_PROMPT_CHARS].strip()
+    logger.warning(f"Ollama prompt truncated: {len(enhanced)} chars (max {MAX_PROMPT_CHARS})")
+    return enhanced
+
+
+def _parse_numbered_list(content: str) -> list[str]:
+    """Extract items from a "1. foo" / "1) foo" numbered list."""
+    return [m.group(1) for line in content.splitlines() if (m := _NUM_RE.match(line))]
+
 
 def list_models() -> list[str]:
     """List available Ollama models."""
     try:
-        response = httpx.get(f"{OLLAMA_HOST}/api/tags", timeout=10.0)
+        response = _CLIENT.get("/api/tags", timeout=10.0)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         return [model["name"] for model in data.get("models", [])]
     except Exception:
         return []
 
 
 def is_available() -> bool:
-    """Check if Ollama server is running and accessible."""
+    """Check if Ollama server is running and accessible (cached briefly)."""
+    now = time.monotonic()
+    if now - _AVAIL_CACHE["t"] < AVAILABILITY_TTL:
+        return _AVAIL_CACHE["v"]
+    
+    # A TCP connect is enough to know the server is up; /api/tags would
+    # make Ollama enumerate installed models on every probe
+    host = urlparse(OLLAMA_HOST)
+    port = host.port or (443 if host.scheme == "https" else 80)
     try:
         logger.debug(f"Checking Ollama availability at {OLLAMA_HOST}")
-        response = httpx.get(f"{OLLAMA_HOST}/api/tags", timeout=5.0)
-        available = response.status_code == 200
+        with socket.create_connection((host.hostname, port), timeout=0.5):
+            available = True
         logger.debug(f"Ollama available: {available}")
-        return available
-    except Exception as e:
+    except OSError as e:
         logger.debug(f"Ollama not available: {e}")
-        return False
+        available = False
+    
+    _AVAIL_CACHE.update(t=now, v=available)
+    return available
+
+
+def _cache_file(model: str, prompt: str, style_hint: Optional[str]) -> Path:
+    """Cache path for an enhancement request (changes if the system prompt does)."""
+    raw = f"{model}|{style_hint}|{prompt}|{ENHANCE_SYSTEM_PROMPT}"
+    key = hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{key}.txt"
+
+
+def _read_cache(cache_file: Path) -> Optional[str]:
+    """Return a cached enhancement, or None on a miss."""
+    try:
+        enhanced = cache_file.read_text()
+    except FileNotFoundError:
+        return None
+    logger.debug(f"Enhanced prompt cache hit: {cache_file.name}")
+    return enhanced
+
+
+def _write_cache(cache_file: Path, enhanced: str) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(enhanced)
+    except OSError as e:
+        logger.debug(f"Could not write prompt cache: {e}")
+
+
+def _enhance_body(model: str, prompt: str, style_hint: Optional[str]) -> bytes:
+    """Streaming /api/chat request body for enhancing one prompt."""
+    user_message = f"Enhance this image generation prompt: {prompt}"
+    if style_hint:
+        user_message += f"\n\nDesired style: {style_hint}"
+    return _dumps({
+        "model": model,
+        "messages": [
+            {"role": "system", "content": ENHANCE_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ],
+        "stream": True,
+        "keep_alive": KEEP_ALIVE,
+        "options": ENHANCE_OPTIONS,
+    })
+
+
+class _EnhancementStream:
+    """Collects streamed chat chunks and decides when to stop reading.
+    
+    We hang up once we have enough text, so Ollama stops generating
+    tokens we would only truncate away.
+    """
+    
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+        self.received = 0
+    
+    def feed(self, line: str) -> bool:
+        """Add one streamed line; returns True when reading can stop."""
+        if not line:
+            return False
+        data = _loads(line)
+        piece = data.get("message", {}).get("content", "")
+        # Include the previous chunk's last char so a split "\n\n" is caught
+        boundary = (self.chunks[-1][-1:] if self.chunks else "") + piece
+        self.chunks.append(piece)
+        self.received += len(piece)
+        return bool(data.get("done")) or self.received >= MAX_PROMPT_CHARS or "\n\n" in boundary
+    
+    def result(self, prompt: str) -> str:
+        """Final enhanced prompt; raises if the model returned nothing."""
+        enhanced = "".join(self.chunks).split("\n\n", 1)[0].strip()
+        if not enhanced:
+            raise ValueError("Ollama returned empty response")
+        
+        # Enforce token limit - truncate if too long
+        enhanced = _truncate_prompt(enhanced)
+        
+        logger.info(f"Ollama enhanced prompt ({len(prompt)} -> {len(enhanced)} chars)")
+        return enhanced
+
+
+def _request_enhancement(model: str, prompt: str, style_hint: Optional[str]) -> str:
+    """Ask Ollama to enhance one prompt; raises on failure or an empty reply."""
+    logger.debug(f"Sending prompt to Ollama model {model}")
+    stream = _EnhancementStream()
+    with _CLIENT.stream(
+        "POST",
+        "/api/chat",
+        content=_enhance_body(model, prompt, style_hint),
+        timeout=20.0,
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if stream.feed(line):
+                break
+    return stream.result(prompt)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_enhancement(model: str, prompt: str, style_hint: Optional[str]) -> str:
+    """Enhancement backed by the on-disk cache; failures raise and are not cached."""
+    cache_file = _cache_file(model, prompt, style_hint)
+    enhanced = _read_cache(cache_file)
+    if enhanced is None:
+        enhanced = _request_enhancement(model, prompt, style_hint)
+        _write_cache(cache_file, enhanced)
+    return enhanced
 
 
 def enhance_prompt(
@@ -51,6 +276,9 @@ def enhance_prompt(
     """
     Enhance a basic prompt using Ollama LLM.
     
+    Results are cached in memory and under ~/.cache/hawk/prompt_enh, so
+    repeating a prompt with the same model and style skips Ollama.
+    
     Args:
         prompt: The user's basic prompt
         model: Ollama model to use (defaults to config OLLAMA_MODEL)
@@ -60,50 +288,153 @@ def enhance_prompt(
         Enhanced prompt string, or original prompt if enhancement fails
     """
     model = model or OLLAMA_MODEL
+    try:
+        return _cached_enhancement(model, prompt, style_hint)
+    except Exception as e:
+        # Return original prompt if enhancement fails
+        logger.error(f"Ollama enhancement failed: {type(e).__name__}: {e}")
+        return prompt
+
+
+async def _enhance_async(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    prompt: str,
+    model: str,
+    style_hint: Optional[str],
+) -> str:
+    """Async counterpart of enhance_prompt sharing the on-disk cache."""
+    cache_file = _cache_file(model, prompt, style_hint)
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return cached
     
-    user_message = f"Enhance this image generation prompt: {prompt}"
+    try:
+        async with limit:
+            stream = _EnhancementStream()
+            async with client.stream(
+                "POST",
+                "/api/chat",
+                content=_enhance_body(model, prompt, style_hint),
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if stream.feed(line):
+                        break
+        enhanced = stream.result(prompt)
+    except Exception as e:
+        logger.error(f"Ollama enhancement failed: {type(e).__name__}: {e}")
+        return prompt
+    
+    _write_cache(cache_file, enhanced)
+    return enhanced
+
+
+@contextlib.asynccontextmanager
+async def async_enhancer(
+    model: Optional[str] = None,
+    style_hint: Optional[str] = None,
+    max_concurrency: int = 4,
+):
+    """
+    Yield an async ``enhance(prompt) -> str`` sharing one AsyncClient.
+    
+    At most max_concurrency requests are in flight; Ollama batches the
+    concurrent requests on the loaded model. The client's pool is bound
+    to the running event loop, so it lives only for the ``async with``.
+    """
+    model = model or OLLAMA_MODEL
+    limit = asyncio.Semaphore(max_concurrency)
+    async with httpx.AsyncClient(
+        base_url=OLLAMA_HOST,
+        timeout=20.0,
+        headers={"Content-Type": "application/json"},
+    ) as client:
+        async def enhance(prompt: str) -> str:
+            return await _enhance_async(client, limit, prompt, model, style_hint)
+        
+        yield enhance
+
+
+def _enhance_chunk(prompts: list[str], model: str, style_hint: Optional[str]) -> list[str]:
+    """One numbered-list request for up to BATCH_CHUNK_SIZE prompts."""
+    user_message = "Enhance these image generation prompts:\n" + "\n".join(
+        f"{i + 1}. {p}" for i, p in enumerate(prompts)
+    )
     if style_hint:
         user_message += f"\n\nDesired style: {style_hint}"
     
     try:
-        logger.debug(f"Sending prompt to Ollama model {model}")
-        response = httpx.post(
-            f"{OLLAMA_HOST}/api/chat",
-            json={
+        logger.debug(f"Sending {len(prompts)} prompts to Ollama model {model}")
+        response = _CLIENT.post(
+            "/api/chat",
+            content=_dumps({
                 "model": model,
                 "messages": [
-                    {"role": "system", "content": ENHANCE_SYSTEM_PROMPT},
+                    {
+                        "role": "system",
+                        "content": ENHANCE_SYSTEM_PROMPT
+                        + "\nReturn one enhanced prompt per input line, numbered 1-N.",
+                    },
                     {"role": "user", "content": user_message},
                 ],
                 "stream": False,
-            },
-            timeout=60.0,
+                "keep_alive": KEEP_ALIVE,
+                "options": {
+                    **ENHANCE_OPTIONS,
+                    "num_predict": ENHANCE_OPTIONS["num_predict"] * len(prompts),
+                    # Items may be blank-line separated; don't stop after the first
+                    "stop": [],
+                },
+            }),
+            timeout=120.0,
         )
         response.raise_for_status()
-        data = response.json()
-        enhanced = data.get("message", {}).get("content", "").strip()
-        
-        if not enhanced:
-            logger.warning("Ollama returned empty response")
-            return prompt
-        
-        # Enforce token limit - truncate if too long
-        if len(enhanced) > MAX_PROMPT_CHARS:
-            # Truncate at last comma or space before limit
-            truncated = enhanced[:MAX_PROMPT_CHARS]
-            last_break = max(truncated.rfind(","), truncated.rfind(" "))
-            if last_break > 150:
-                enhanced = truncated[:last_break].rstrip(",").strip()
-            else:
-                enhanced = truncated.strip()
-            logger.warning(f"Ollama prompt truncated: {len(enhanced)} chars (max {MAX_PROMPT_CHARS})")
-        
-        logger.info(f"Ollama enhanced prompt ({len(prompt)} -> {len(enhanced)} chars)")
-        return enhanced
+        data = _loads(response.content)
+        enhanced = _parse_numbered_list(data.get("message", {}).get("content", ""))
     except Exception as e:
-        # Return original prompt if enhancement fails
-        logger.error(f"Ollama enhancement failed: {type(e).__name__}: {e}")
-        return prompt
+        logger.error(f"Ollama batch enhancement failed: {type(e).__name__}: {e}")
+        return list(prompts)
+    
+    if len(enhanced) != len(prompts):
+        logger.warning(f"Ollama returned {len(enhanced)} prompts for {len(prompts)} inputs")
+    
+    results = []
+    for i, prompt in enumerate(prompts):
+        if i < len(enhanced) and enhanced[i]:
+            results.append(_truncate_prompt(enhanced[i]))
+        else:
+            results.append(prompt)
+    return results
+
+
+def enhance_prompts_batch(
+    prompts: list[str],
+    model: Optional[str] = None,
+    style_hint: Optional[str] = None,
+) -> list[str]:
+    """
+    Enhance several prompts with one Ollama request per BATCH_CHUNK_SIZE prompts.
+    
+    Args:
+        prompts: The user's basic prompts
+        model: Ollama model to use (defaults to config OLLAMA_MODEL)
+        style_hint: Optional style guidance applied to every prompt
+    
+    Returns:
+        Enhanced prompts in input order; any prompt the model didn't
+        return (or a whole chunk, if its request fails) is left unchanged
+    """
+    if not prompts:
+        return []
+    model = model or OLLAMA_MODEL
+    
+    results = []
+    for i in range(0, len(prompts), BATCH_CHUNK_SIZE):
+        results.extend(_enhance_chunk(prompts[i:i + BATCH_CHUNK_SIZE], model, style_hint))
+    
+    logger.info(f"Ollama enhanced {len(prompts)} prompts in batched requests")
+    return results
 
 
 def generate_prompts(
@@ -135,33 +466,24 @@ Return each prompt on a new line, numbered 1-N. No other text."""
         user_message += f"\nStyle: {style}"
     
     try:
-        response = httpx.post(
-            f"{OLLAMA_HOST}/api/chat",
-            json={
+        response = _CLIENT.post(
+            "/api/chat",
+            content=_dumps({
                 "model": model,
                 "messages": [
                     {"role": "system", "content": system},
                     {"role": "user", "content": user_message},
                 ],
                 "stream": False,
-            },
+            }),
             timeout=120.0,
         )
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         content = data.get("message", {}).get("content", "")
         
         # Parse numbered list
-        prompts = []
-        for line in content.strip().split("\n"):
-            line = line.strip()
-            if line and line[0].isdigit():
-                # Remove number prefix like "1. " or "1) "
-                parts = line.split(". ", 1) if ". " in line else line.split(") ", 1)
-                if len(parts) > 1:
-                    prompts.append(parts[1].strip())
-                else:
-                    prompts.append(line)
+        prompts = _parse_numbered_list(content)
         
         return prompts[:count] if prompts else []
     except Exception:
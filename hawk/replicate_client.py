@@ -1,6 +1,9 @@
 """Replicate API client for image generation."""
 
+import asyncio
 import os
+import time
+import random
 import httpx
 import replicate
 from pathlib import Path
@@ -19,6 +22,11 @@ from hawk.config import Project, REPLICATE_DEFAULT_PARAMS
 # Cache for model versions
 _model_versions: dict[str, str] = {}
 
+# Image download retry policy (transient CDN/network errors only), shared
+# with scripts that download Replicate outputs themselves
+DOWNLOAD_ATTEMPTS = 3
+_RETRYABLE_STATUS = {408, 429}
+_CHUNK_SIZE = 65536
 
 def _get_model_version(model_name: str) -> str:
     """Get the latest version for a model, caching the result."""
@@ -28,6 +36,60 @@ def _get_model_version(model_name: str) -> str:
     return _model_versions[model_name]
 
 
+def is_retryable(exc: httpx.HTTPError) -> bool:
+    """True for timeouts, connection errors, 5xx, 408 and 429."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code >= 500 or code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+def retry_delay(attempt: int, exc: httpx.HTTPError) -> Optional[float]:
+    """Seconds to back off after failed attempt (0-based), or None to give up."""
+    if attempt >= DOWNLOAD_ATTEMPTS - 1 or not is_retryable(exc):
+        return None
+    return 2 ** attempt + random.random()
+
+
+def _download(url: str, filepath: Path) -> None:
+    """Download url to filepath, retrying transient failures with backoff."""
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        try:
+            response = httpx.get(url, follow_redirects=True, timeout=60)
+            response.raise_for_status()
+            break
+        except httpx.HTTPError as e:
+            delay = retry_delay(attempt, e)
+            if delay is None:
+                raise
+            time.sleep(delay)
+
+    with open(filepath, "wb") as f:
+        f.write(response.content)
+
+
+async def download_async(client: httpx.AsyncClient, url: str, filepath: Path) -> None:
+    """
+    Stream url to filepath with the same retry policy as generate_image.
+
+    A partly written file is removed if the download ultimately fails.
+    """
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        try:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                with open(filepath, "wb") as f:
+                    async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                        f.write(chunk)
+            return
+        except httpx.HTTPError as e:
+            delay = retry_delay(attempt, e)
+            if delay is None:
+                filepath.unlink(missing_ok=True)
+                raise
+            await asyncio.sleep(delay)
+
+
 def generate_image(
     project: Project,
     prompt: str,
@@ -65,7 +127,8 @@ def generate_image(
 
     # Download images
     saved_paths = []
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep filenames unique when batch jobs run concurrently
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
 
     urls = output if isinstance(output, list) else [output]
 
@@ -76,13 +139,7 @@ def generate_image(
         filename = f"{timestamp}_{safe_prompt}_{i+1}.png"
         filepath = project.images_dir / filename
 
-        # Download
-        response = httpx.get(str(url), follow_redirects=True)
-        response.raise_for_status()
-
-        with open(filepath, "wb") as f:
-            f.write(response.content)
-
+        _download(str(url), filepath)
         saved_paths.append(filepath)
 
     return saved_paths
@@ -103,13 +160,7 @@ def generate_batch(
 
 def get_project_images(project: Project) -> list[Path]:
     """Get all images in a project's images folder."""
-    project.ensure_dirs()
-    extensions = {".png", ".jpg", ".jpeg", ".webp"}
-    images = [
-        f for f in project.images_dir.iterdir()
-        if f.suffix.lower() in extensions
-    ]
-    return sorted(images, key=lambda x: x.stat().st_mtime, reverse=True)
+    return project.list_images()
 
 
 def delete_image(image_path: Path) -> bool:
@@ -1,7 +1,9 @@
 """Interactive setup for Hawk TUI."""
 
 import os
+import re
 import sys
+import tomllib
 from pathlib import Path
 
 # Config file location (XDG standard)
@@ -20,24 +22,29 @@ def config_exists() -> bool:
 
 
 def load_config() -> dict:
-    """Load config from file, return empty dict if not found."""
+    """Load config from file as strings, return empty dict if missing or unreadable."""
     if not CONFIG_FILE.exists():
         return {}
 
-    config = {}
     try:
-        with open(CONFIG_FILE) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    config[key] = value
-    except Exception:
+        with open(CONFIG_FILE, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        print(f"Warning: ignoring {CONFIG_FILE}: {e}", file=sys.stderr)
         return {}
 
-    return config
+    return {key: str(value) for key, value in data.items()}
+
+
+# Characters TOML basic strings can't contain unescaped
+_TOML_CONTROL = re.compile(r"[\x00-\x1f\x7f]")
+
+
+def _toml_string(value) -> str:
+    """Quote a value as a TOML basic string."""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    escaped = _TOML_CONTROL.sub(lambda m: f"\\u{ord(m.group()):04x}", escaped)
+    return f'"{escaped}"'
 
 
 def save_config(config: dict) -> None:
@@ -50,28 +57,28 @@ def save_config(config: dict) -> None:
 
         f.write("# Image Generation Backend\n")
         if "USE_LOCAL_IMAGE_GEN" in config:
-            f.write(f'USE_LOCAL_IMAGE_GEN = "{config["USE_LOCAL_IMAGE_GEN"]}"\n')
+            f.write(f'USE_LOCAL_IMAGE_GEN = {_toml_string(config["USE_LOCAL_IMAGE_GEN"])}\n')
 
         if "REPLICATE_API_TOKEN" in config:
-            f.write(f'REPLICATE_API_TOKEN = "{config["REPLICATE_API_TOKEN"]}"\n')
+            f.write(f'REPLICATE_API_TOKEN = {_toml_string(config["REPLICATE_API_TOKEN"])}\n')
 
         f.write("\n# Local Model Settings (if USE_LOCAL_IMAGE_GEN=true)\n")
         if "SD_MODEL" in config:
-            f.write(f'SD_MODEL = "{config["SD_MODEL"]}"\n')
+            f.write(f'SD_MODEL = {_toml_string(config["SD_MODEL"])}\n')
         if "SD_INFERENCE_STEPS" in config:
-            f.write(f'SD_INFERENCE_STEPS = "{config["SD_INFERENCE_STEPS"]}"\n')
+            f.write(f'SD_INFERENCE_STEPS = {_toml_string(config["SD_INFERENCE_STEPS"])}\n')
         if "SD_GUIDANCE_SCALE" in config:
-            f.write(f'SD_GUIDANCE_SCALE = "{config["SD_GUIDANCE_SCALE"]}"\n')
+            f.write(f'SD_GUIDANCE_SCALE = {_toml_string(config["SD_GUIDANCE_SCALE"])}\n')
 
         f.write("\n# Ollama Prompt Enhancement (optional)\n")
         if "USE_OLLAMA" in config:
-            f.write(f'USE_OLLAMA = "{config["USE_OLLAMA"]}"\n')
+            f.write(f'USE_OLLAMA = {_toml_string(config["USE_OLLAMA"])}\n')
         if "OLLAMA_MODEL" in config:
-            f.write(f'OLLAMA_MODEL = "{config["OLLAMA_MODEL"]}"\n')
+            f.write(f'OLLAMA_MODEL = {_toml_string(config["OLLAMA_MODEL"])}\n')
 
         f.write("\n# Content Directory (where images/videos are saved)\n")
         if "CONTENT_DIR" in config:
-            f.write(f'CONTENT_DIR = "{config["CONTENT_DIR"]}"\n')
+            f.write(f'CONTENT_DIR = {_toml_string(config["CONTENT_DIR"])}\n')
 
 
 def print_banner():
@@ -0,0 +1,50 @@
+"""Headless checks for ImageList partial repaints."""
+
+import asyncio
+from pathlib import Path
+
+from textual.app import App, ComposeResult
+
+from hawk.app import HawkTUI, ImageList
+
+# Cursor glyph from CURSOR_MARK, without its markup
+CURSOR = "▶"
+
+
+class _ImageListApp(App):
+    """Minimal host using the real app's ImageList styles (focus border)."""
+
+    CSS = HawkTUI.CSS
+
+    def compose(self) -> ComposeResult:
+        yield ImageList(id="image-list")
+
+
+def _cursor_lines(image_list: ImageList) -> list[int]:
+    """Widget lines whose content shows the cursor mark."""
+    return [
+        y for y in range(image_list.size.height)
+        if CURSOR in image_list.render_line(y).text
+    ]
+
+
+def test_cursor_moves_leave_single_mark():
+    async def run() -> None:
+        app = _ImageListApp()
+        async with app.run_test(size=(60, 20)) as pilot:
+            image_list = app.query_one(ImageList)
+            image_list.set_images([Path(f"img_{i}.png") for i in range(6)])
+            image_list.focus()
+            await pilot.pause()
+            first = _cursor_lines(image_list)
+            assert len(first) == 1
+
+            for _ in range(3):
+                await pilot.press("down")
+            await pilot.pause()
+
+            assert _cursor_lines(image_list) == [first[0] + 3]
+            # The composited screen must not keep stale marks on old rows
+            assert app.export_screenshot().count(CURSOR) == 1
+
+    asyncio.run(run())